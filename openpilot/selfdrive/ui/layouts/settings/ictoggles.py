@@ -1,3 +1,5 @@
+from functools import partial
+
 from openpilot.common.params import Params, UnknownKeyName
 from openpilot.system.ui.widgets import Widget
 from openpilot.system.ui.widgets.list_view import toggle_item
@@ -57,100 +59,117 @@ DESCRIPTIONS = {
 }
 
 
+class _DescriptionProxy:
+  # callable description that translates lazily; one shared code object instead
+  # of a fresh closure per toggle
+  __slots__ = ('og_desc', 'add_desc')
+
+  def __init__(self, og_desc: str, add_desc: str):
+    self.og_desc = og_desc
+    self.add_desc = add_desc
+
+  def __call__(self) -> str:
+    return tr(self.og_desc) + (" " + tr(self.add_desc) if self.add_desc else "")
+
+
 class ICTogglesLayout(Widget):
+  # param, title, desc, icon, needs_restart
+  # built once at class creation -- the title lambdas only close over literals,
+  # so every instance can share the same table
+  _toggle_defs = {
+    "EnableCurvatureController": (
+      lambda: tr("VW: Lateral Correction (Recommended)"),
+      DESCRIPTIONS["EnableCurvatureController"],
+      "chffr_wheel.png",
+      False,
+    ),
+    "EnableLongComfortMode": (
+      lambda: tr("VW: Longitudinal Comfort Mode"),
+      DESCRIPTIONS["EnableLongComfortMode"],
+      "chffr_wheel.png",
+      False,
+    ),
+    "EnableSpeedLimitControl": (
+      lambda: tr("VW: Speed Limit Control"),
+      DESCRIPTIONS["EnableSpeedLimitControl"],
+      "speed_limit.png",
+      False,
+    ),
+    "EnableSpeedLimitPredicative": (
+      lambda: tr("VW: Predicative Speed Limit (pACC)"),
+      DESCRIPTIONS["EnableSpeedLimitPredicative"],
+      "speed_limit.png",
+      False,
+    ),
+    "EnableSLPredReactToSL": (
+      lambda: tr("VW: Predicative - Reaction to Speed Limits"),
+      DESCRIPTIONS["EnableSLPredReactToSL"],
+      "speed_limit.png",
+      False,
+    ),
+    "EnableSLPredReactToCurves": (
+      lambda: tr("VW: Predicative - Reaction to Curves"),
+      DESCRIPTIONS["EnableSLPredReactToCurves"],
+      "speed_limit.png",
+      False,
+    ),
+    "ForceRHDForBSM": (
+      lambda: tr("VW: Force RHD for BSM"),
+      DESCRIPTIONS["ForceRHDForBSM"],
+      "chffr_wheel.png",
+      False,
+    ),
+    "DisableCarSteerAlerts": (
+      lambda: tr("VW: Disable Car Steer Alert Chime"),
+      DESCRIPTIONS["DisableCarSteerAlerts"],
+      "chffr_wheel.png",
+      False,
+    ),
+    "EnableSmoothSteer": (
+      lambda: tr("Steer Smoothing"),
+      DESCRIPTIONS["EnableSmoothSteer"],
+      "chffr_wheel.png",
+      False,
+    ),
+    "DarkMode": (
+      lambda: tr("Dark Mode"),
+      DESCRIPTIONS["DarkMode"],
+      "eye_closed.png",
+      False,
+    ),
+    "DisableScreenTimer": (
+      lambda: tr("Onroad Screen Timeout"),
+      DESCRIPTIONS["DisableScreenTimer"],
+      "eye_closed.png",
+      False,
+    ),
+    "BatteryDetails": (
+      lambda: tr("VW MEB: Display Battery Details"),
+      DESCRIPTIONS["BatteryDetails"],
+      "capslock-fill.png",
+      False,
+    ),
+    "EnableCurvatureD": (
+      lambda: tr("Enable Dynamic Steering Learner"),
+      DESCRIPTIONS["EnableCurvatureD"],
+      "chffr_wheel.png",
+      False,
+    ),
+    "ShowDynamicSteeringLearnerGraph": (
+      lambda: tr("Show Dynamic Steering Learner Graph"),
+      DESCRIPTIONS["ShowDynamicSteeringLearnerGraph"],
+      "chffr_wheel.png",
+      False,
+    ),
+  }
+
   def __init__(self):
     super().__init__()
     self._params = Params()
 
-    # param, title, desc, icon, needs_restart
-    self._toggle_defs = {
-      "EnableCurvatureController": (
-        lambda: tr("VW: Lateral Correction (Recommended)"),
-        DESCRIPTIONS["EnableCurvatureController"],
-        "chffr_wheel.png",
-        False,
-      ),
-      "EnableLongComfortMode": (
-        lambda: tr("VW: Longitudinal Comfort Mode"),
-        DESCRIPTIONS["EnableLongComfortMode"],
-        "chffr_wheel.png",
-        False,
-      ),
-      "EnableSpeedLimitControl": (
-        lambda: tr("VW: Speed Limit Control"),
-        DESCRIPTIONS["EnableSpeedLimitControl"],
-        "speed_limit.png",
-        False,
-      ),
-      "EnableSpeedLimitPredicative": (
-        lambda: tr("VW: Predicative Speed Limit (pACC)"),
-        DESCRIPTIONS["EnableSpeedLimitPredicative"],
-        "speed_limit.png",
-        False,
-      ),
-      "EnableSLPredReactToSL": (
-        lambda: tr("VW: Predicative - Reaction to Speed Limits"),
-        DESCRIPTIONS["EnableSLPredReactToSL"],
-        "speed_limit.png",
-        False,
-      ),
-      "EnableSLPredReactToCurves": (
-        lambda: tr("VW: Predicative - Reaction to Curves"),
-        DESCRIPTIONS["EnableSLPredReactToCurves"],
-        "speed_limit.png",
-        False,
-      ),
-      "ForceRHDForBSM": (
-        lambda: tr("VW: Force RHD for BSM"),
-        DESCRIPTIONS["ForceRHDForBSM"],
-        "chffr_wheel.png",
-        False,
-      ),
-      "DisableCarSteerAlerts": (
-        lambda: tr("VW: Disable Car Steer Alert Chime"),
-        DESCRIPTIONS["DisableCarSteerAlerts"],
-        "chffr_wheel.png",
-        False,
-      ),
-      "EnableSmoothSteer": (
-        lambda: tr("Steer Smoothing"),
-        DESCRIPTIONS["EnableSmoothSteer"],
-        "chffr_wheel.png",
-        False,
-      ),
-      "DarkMode": (
-        lambda: tr("Dark Mode"),
-        DESCRIPTIONS["DarkMode"],
-        "eye_closed.png",
-        False,
-      ),
-      "DisableScreenTimer": (
-        lambda: tr("Onroad Screen Timeout"),
-        DESCRIPTIONS["DisableScreenTimer"],
-        "eye_closed.png",
-        False,
-      ),
-      "BatteryDetails": (
-        lambda: tr("VW MEB: Display Battery Details"),
-        DESCRIPTIONS["BatteryDetails"],
-        "capslock-fill.png",
-        False,
-      ),
-      "EnableCurvatureD": (
-        lambda: tr("Enable Dynamic Steering Learner"),
-        DESCRIPTIONS["EnableCurvatureD"],
-        "chffr_wheel.png",
-        False,
-      ),
-      "ShowDynamicSteeringLearnerGraph": (
-        lambda: tr("Show Dynamic Steering Learner Graph"),
-        DESCRIPTIONS["ShowDynamicSteeringLearnerGraph"],
-        "chffr_wheel.png",
-        False,
-      ),
-    }
-
     self._toggles = {}
+    self._toggle_states: dict[str, bool] = {}
+    self._enabled_states: dict[str, bool] = {}
     self._locked_toggles = set()
     self._offroad_only_toggles = {"EnableCurvatureD"}
     for param, (title, desc, icon, needs_restart) in self._toggle_defs.items():
@@ -158,7 +177,7 @@ class ICTogglesLayout(Widget):
         title,
         desc,
         self._params.get_bool(param),
-        callback=lambda state, p=param: self._toggle_callback(state, p),
+        callback=partial(self._toggle_callback, param=param),
         icon=icon,
       )
 
@@ -172,7 +191,7 @@ class ICTogglesLayout(Widget):
       additional_desc = ""
       if needs_restart and not locked:
         additional_desc = tr("Changing this setting will restart openpilot if the car is powered on.")
-      toggle.set_description(lambda og_desc=toggle.description, add_desc=additional_desc: tr(og_desc) + (" " + tr(add_desc) if add_desc else ""))
+      toggle.set_description(_DescriptionProxy(toggle.description, additional_desc))
 
       # track for engaged state updates
       if locked:
@@ -198,21 +217,26 @@ class ICTogglesLayout(Widget):
     ui_state.update_params()
 
     # TODO: make a param control list item so we don't need to manage internal state as much here
-    # refresh toggles from params to mirror external changes
+    # refresh toggles from params to mirror external changes, skipping params that haven't moved
     for param in self._toggle_defs:
-      self._toggles[param].action_item.set_state(ui_state.params.get_bool(param))
+      value = ui_state.params.get_bool(param)
+      if self._toggle_states.get(param) != value:
+        self._toggles[param].action_item.set_state(value)
+        self._toggle_states[param] = value
 
     # these toggles need restart, block while engaged
     for toggle_def in self._toggle_defs:
       if self._toggle_defs[toggle_def][3] and toggle_def not in self._locked_toggles:
-        self._toggles[toggle_def].action_item.set_enabled(not ui_state.engaged)
+        self._set_enabled(toggle_def, not ui_state.engaged)
 
     for toggle_def in self._offroad_only_toggles:
       if toggle_def not in self._locked_toggles:
-        self._toggles[toggle_def].action_item.set_enabled(ui_state.is_offroad())
+        self._set_enabled(toggle_def, ui_state.is_offroad())
 
-    if "EnableCurvatureD" not in self._locked_toggles:
-      self._toggles["EnableCurvatureD"].action_item.set_enabled(ui_state.is_offroad())
+  def _set_enabled(self, param: str, enabled: bool):
+    if self._enabled_states.get(param) != enabled:
+      self._toggles[param].action_item.set_enabled(enabled)
+      self._enabled_states[param] = enabled
 
   def _render(self, rect):
     self._scroller.render(rect)
@@ -64,6 +64,8 @@ class ICTogglesLayoutMici(NavScroller):
       ("ShowDynamicSteeringLearnerGraph", show_curvatured_graph),
     )
 
+    self._toggle_states: dict[str, bool] = {}
+
     enable_curvatured.set_enabled(lambda: ui_state.is_offroad())
 
     if ui_state.params.get_bool("ShowDebugInfo"):
@@ -83,6 +85,9 @@ class ICTogglesLayoutMici(NavScroller):
   def _update_toggles(self):
     ui_state.update_params()
 
-    # Refresh toggles from params to mirror external changes
+    # Refresh toggles from params to mirror external changes, skipping params that haven't moved
     for key, item in self._refresh_toggles:
-      item.set_checked(ui_state.params.get_bool(key))
+      value = ui_state.params.get_bool(key)
+      if self._toggle_states.get(key) != value:
+        item.set_checked(value)
+        self._toggle_states[key] = value
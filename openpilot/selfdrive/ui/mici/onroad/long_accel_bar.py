@@ -1,5 +1,5 @@
-from functools import wraps
-from collections import OrderedDict
+import math
+from functools import lru_cache
 
 import numpy as np
 import pyray as rl
@@ -9,93 +9,126 @@ from openpilot.selfdrive.ui.mici.onroad import blend_colors
 from openpilot.selfdrive.ui.ui_state import ui_state, UIStatus
 from openpilot.system.ui.widgets import Widget
 from openpilot.system.ui.lib.application import gui_app
-from openpilot.common.filter_simple import FirstOrderFilter
 from openpilot.system.ui.lib.shader_polygon import draw_polygon, Gradient
 
 
 ACCEL_MAX = 2.0
 ACCEL_MIN = -3.5
 
+# reciprocal normalization factors indexed by the sign bit (False=0 -> positive)
+_NORM_INV = (1.0 / ACCEL_MAX, 1.0 / -ACCEL_MIN)
+
 GearShifter = car.CarState.GearShifter
 
+_DT = 1.0 / gui_app.target_fps
+
+# first-order filter coefficients, k = dt / (rc + dt)
+_K_ACCEL = _DT / (0.15 + _DT)
+_K_LOAD = _DT / (0.20 + _DT)
+_K_ALPHA = _DT / (0.10 + _DT)
+
 
 def clamp(x: float, lo: float, hi: float) -> float:
-  return lo if x < lo else hi if x > hi else x
-
-
-def quantized_lru_cache(maxsize=256):
-  def decorator(func):
-    cache = OrderedDict()
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-      q_args = []
-      for a in args:
-        if isinstance(a, float):
-          q_args.append(round(a * 2) / 2)
-        else:
-          q_args.append(a)
-      key = (tuple(q_args), tuple(sorted(kwargs.items())))
-      if key in cache:
-        cache.move_to_end(key)
-      else:
-        if len(cache) >= maxsize:
-          cache.popitem(last=False)
-        cache[key] = func(*args, **kwargs)
-      return cache[key]
+  return min(hi, max(lo, x))
+
+
+def _q(x: float) -> int:
+  # half-pixel quantization keeps the geometry caches small without visible stepping
+  return round(x * 2)
+
+
+# every arc in this file sweeps a single 90 degree quadrant with the same segment
+# count, so the unit-circle points can be baked once at import instead of running
+# linspace/cos/sin on every cache miss
+_ARC_SEGS = 9
+
+
+def _unit_arc(a0_deg: float, a1_deg: float, segs: int) -> np.ndarray:
+  # scalar math.cos/sin beats the NumPy ufunc dispatch for arcs this small
+  segs = max(2, segs)
+  a0 = math.radians(a0_deg)
+  step = math.radians(a1_deg - a0_deg) / (segs - 1)
+  return np.array([(math.cos(a0 + i * step), math.sin(a0 + i * step)) for i in range(segs)], dtype=np.float32)
+
 
-    return wrapper
-  return decorator
+_UNIT_ARCS = {span: _unit_arc(*span, _ARC_SEGS) for span in ((270, 360), (0, 90), (90, 180), (180, 270))}
 
 
 def _arc(cx: float, cy: float, r: float, a0_deg: float, a1_deg: float, segs: int) -> np.ndarray:
-  a = np.deg2rad(np.linspace(a0_deg, a1_deg, max(2, segs)))
-  return np.c_[cx + np.cos(a) * r, cy + np.sin(a) * r]
+  unit = _UNIT_ARCS.get((a0_deg, a1_deg)) if segs == _ARC_SEGS else None
+  if unit is None:
+    unit = _unit_arc(a0_deg, a1_deg, segs)
+  return unit * r + (cx, cy)
 
 
-@quantized_lru_cache(maxsize=256)
-def rounded_rect_pts(x: float, y: float, w: float, h: float, r: float, segs: int = 9) -> np.ndarray:
+@lru_cache(maxsize=256)
+def _rounded_rect_pts_q(xq: int, yq: int, wq: int, hq: int, rq: int, segs: int) -> np.ndarray:
+  x, y, w, h, r = xq * 0.5, yq * 0.5, wq * 0.5, hq * 0.5, rq * 0.5
   r = max(0.0, min(r, w * 0.5, h * 0.5))
   if r <= 0.01:
     return np.array([[x, y], [x + w, y], [x + w, y + h], [x, y + h], [x, y]], dtype=np.float32)
 
-  tr = _arc(x + w - r, y + r, r, 270, 360, segs)
-  br = _arc(x + w - r, y + h - r, r, 0, 90, segs)
-  bl = _arc(x + r, y + h - r, r, 90, 180, segs)
-  tl = _arc(x + r, y + r, r, 180, 270, segs)
-  return np.vstack([tr, br, bl, tl, tr[:1]]).astype(np.float32)
+  n = max(2, segs)
+  out = np.empty((4 * n + 1, 2), dtype=np.float32)
+  out[0:n] = _arc(x + w - r, y + r, r, 270, 360, segs)
+  out[n:2 * n] = _arc(x + w - r, y + h - r, r, 0, 90, segs)
+  out[2 * n:3 * n] = _arc(x + r, y + h - r, r, 90, 180, segs)
+  out[3 * n:4 * n] = _arc(x + r, y + r, r, 180, 270, segs)
+  out[4 * n] = out[0]
+  return out
 
 
-@quantized_lru_cache(maxsize=256)
-def rounded_cap_segment_pts(x: float, y: float, w: float, h: float, r: float, *, cap: str, segs: int = 9) -> np.ndarray:
-  r = max(0.0, min(r, w * 0.5, h * 0.5))
-  if r <= 0.01:
-    return np.array([[x, y], [x + w, y], [x + w, y + h], [x, y + h], [x, y]], dtype=np.float32)
+def rounded_rect_pts(x: float, y: float, w: float, h: float, r: float, segs: int = 9) -> np.ndarray:
+  return _rounded_rect_pts_q(_q(x), _q(y), _q(w), _q(h), _q(r), segs)
+
+
+def _arc_into(out: np.ndarray, unit: np.ndarray, r: float, cx: float, cy: float):
+  np.multiply(unit, r, out=out)
+  out[:, 0] += cx
+  out[:, 1] += cy
+
+
+# point count of a rounded cap segment at _ARC_SEGS per corner arc
+_SEG_PTS = 2 * _ARC_SEGS + 5
+
 
-  if cap == "top":
-    tr = _arc(x + w - r, y + r, r, 270, 360, segs)
-    tl = _arc(x + r, y + r, r, 180, 270, segs)
-    return np.vstack([
-      tr,
-      [x + w, y + r],
-      [x + w, y + h],
-      [x,     y + h],
-      [x,     y + r],
-      tl,
-      tr[:1],
-    ]).astype(np.float32)
-
-  br = _arc(x + w - r, y + h - r, r, 0, 90, segs)
-  bl = _arc(x + r, y + h - r, r, 90, 180, segs)
-  return np.vstack([
-    [x + w, y],
-    [x + w, y + h - r],
-    br,
-    bl,
-    [x,     y + h - r],
-    [x,     y],
-    [x + w, y],
-  ]).astype(np.float32)
+def fill_cap_pts(buf: np.ndarray, x: float, y: float, w: float, h: float, r: float, top: bool) -> np.ndarray:
+  # in-place builder for the fill-segment polygon: its height tracks the live
+  # filter output and changes every frame, so caching is a guaranteed miss --
+  # write into a reusable buffer instead of allocating a fresh ndarray
+  r = max(0.0, min(r, w * 0.5, h * 0.5))
+  n = _ARC_SEGS
+  if top:
+    _arc_into(buf[0:n], _UNIT_ARCS[(270, 360)], r, x + w - r, y + r)
+    buf[n] = (x + w, y + r)
+    buf[n + 1] = (x + w, y + h)
+    buf[n + 2] = (x, y + h)
+    buf[n + 3] = (x, y + r)
+    _arc_into(buf[n + 4:2 * n + 4], _UNIT_ARCS[(180, 270)], r, x + r, y + r)
+  else:
+    buf[0] = (x + w, y)
+    buf[1] = (x + w, y + h - r)
+    _arc_into(buf[2:n + 2], _UNIT_ARCS[(0, 90)], r, x + w - r, y + h - r)
+    _arc_into(buf[n + 2:2 * n + 2], _UNIT_ARCS[(90, 180)], r, x + r, y + h - r)
+    buf[2 * n + 2] = (x, y + h - r)
+    buf[2 * n + 3] = (x, y)
+  buf[2 * n + 4] = buf[0]
+  return buf
+
+
+
+@lru_cache(maxsize=256)
+def _color(r: int, g: int, b: int, a: int) -> rl.Color:
+  # rl.Color is a ctypes struct; with 8-bit channels the same handful of values
+  # recurs every frame, so cache instead of reallocating
+  return rl.Color(r, g, b, a)
+
+
+# fill colors baked for all 256 quantized blend fractions per polarity;
+# blend_colors interpolates in HSV and drops the input alphas, so each entry
+# depends only on the fraction and which end color is in play
+_FILL_POS = tuple(blend_colors(rl.Color(255, 255, 255, 255), rl.Color(255, 200, 0, 255), i / 255.0) for i in range(256))
+_FILL_NEG = tuple(blend_colors(rl.Color(255, 255, 255, 255), rl.Color(255, 115, 0, 255), i / 255.0) for i in range(256))
 
 
 class LongitudinalAccelBar(Widget):
@@ -105,22 +138,47 @@ class LongitudinalAccelBar(Widget):
     self._scale = scale
     self._always = always
 
-    # filtered effect and request values
-    self._aego_f = FirstOrderFilter(0.0, 0.15, 1 / gui_app.target_fps)
-    self._ades_f = FirstOrderFilter(0.0, 0.15, 1 / gui_app.target_fps)
+    # first-order filter state inlined as plain floats: x += k * (u - x) on
+    # scalars has no method-call or array-temporary overhead per frame
+    self._aego_x = 0.0
+    self._ades_x = 0.0
+    self._load_x = 0.0
+    self._alpha_x = 0.0
+
+    # demo never changes over the widget's lifetime, so pick the per-frame
+    # visibility/color-mode path once instead of re-branching every render
+    self._frame_mode = self._frame_mode_demo if demo else self._frame_mode_live
+
+    # reusable polygon buffer for the per-frame fill segment
+    self._seg_buf = np.empty((_SEG_PTS, 2), dtype=np.float32)
+
+    # static bar geometry, recomputed only when the parent rect changes
+    self._geom_key: tuple[float, float, float, float] | None = None
+    self._geom: tuple[int, int, int, int, int, float, float, float] = (0, 0, 0, 0, 0, 0.0, 0.0, 0.0)
+
+  @staticmethod
+  def _frame_mode_demo() -> tuple[float, bool]:
+    return 1.0, True
 
-    # load / visibility filters
-    self._mag_f = FirstOrderFilter(0.0, 0.20, 1 / gui_app.target_fps)
-    self._alpha_f = FirstOrderFilter(0.0, 0.10, 1 / gui_app.target_fps)
+  def _frame_mode_live(self) -> tuple[float, bool]:
+    status = ui_state.status
+    visible = self._always or (status != UIStatus.DISENGAGED)
+    return (1.0 if visible else 0.0), status in (UIStatus.ENGAGED, UIStatus.LONG_ONLY)
 
   def update_filter(self, aego: float, ades: float = 0.0):
-    self._aego_f.update(aego)
-    self._ades_f.update(ades)
+    self._aego_x += _K_ACCEL * (aego - self._aego_x)
+    self._ades_x += _K_ACCEL * (ades - self._ades_x)
 
   def _update_state(self):
     if self._demo:
       return
 
+    # once hidden and every filter has settled to zero there is nothing left to
+    # animate, so skip the capnp reads and filter math until the bar fades back in
+    visible = self._always or (ui_state.status != UIStatus.DISENGAGED)
+    if not visible and self._alpha_x < 1e-3 and abs(self._aego_x) < 1e-3 and abs(self._ades_x) < 1e-3:
+      return
+
     cs = ui_state.sm['carState']
     cc = ui_state.sm['carControl']
 
@@ -128,99 +186,96 @@ class LongitudinalAccelBar(Widget):
     if cs.gearShifter == GearShifter.reverse:
       aego = -aego
 
-    self._aego_f.update(aego)
-    self._ades_f.update(float(cc.actuators.accel))
-
-  @staticmethod
-  def _norm_acc(a: float) -> float:
-    return a / max(1e-3, (ACCEL_MAX if a >= 0.0 else -ACCEL_MIN))
+    self.update_filter(aego, float(cc.actuators.accel))
 
   def _render(self, rect: rl.Rectangle):
-    # alignment
-    bar_w = int(19 * self._scale)
-    right_margin = int(24 * self._scale)
-    bar_x = int(rect.x + rect.width - bar_w - right_margin)
-
-    # vertical span
-    status_dot_radius = int(24 * self._scale)
-    bar_h_max = int(rect.height - 2 * status_dot_radius)
-    bar_h_min = int(160 * self._scale)
-    bar_h = int(clamp(bar_h_max, bar_h_min, max(bar_h_min, bar_h_max)))
-    bar_y = int(rect.y + status_dot_radius)
-
-    # visibility
-    if self._demo:
-      self._alpha_f.update(1.0)
-    else:
-      visible = self._always or (ui_state.status != UIStatus.DISENGAGED)
-      self._alpha_f.update(1.0 if visible else 0.0)
+    # visibility and color mode; resolve the fade before any geometry work so
+    # a fully faded-out bar costs just the filter step and one compare
+    visible_target, colored = self._frame_mode()
 
-    alpha = clamp(self._alpha_f.x, 0.0, 1.0)
+    aego = clamp(self._aego_x, ACCEL_MIN, ACCEL_MAX)
+    ades = clamp(self._ades_x, ACCEL_MIN, ACCEL_MAX)
+
+    naego = clamp(aego * _NORM_INV[aego < 0.0], -1.0, 1.0)
+    nades = clamp(ades * _NORM_INV[ades < 0.0], -1.0, 1.0)
+
+    # load scaling (TorqueBar-like growth) and fade
+    self._load_x += _K_LOAD * (clamp(abs(nades), 0.0, 1.0) - self._load_x)
+    self._alpha_x += _K_ALPHA * (visible_target - self._alpha_x)
+
+    # quantize the fade/load outputs below the display threshold: the filters
+    # asymptote for many frames with sub-1/255 deltas, and stable values keep
+    # the color and geometry cache keys from churning
+    alpha = round(clamp(self._alpha_x, 0.0, 1.0) * 255) / 255
     if alpha <= 0.001:
       return
 
-    # color mode
-    colored = self._demo or (ui_state.status in (UIStatus.ENGAGED, UIStatus.LONG_ONLY))
-    dim = 1.0 if colored else 0.55
+    geom_key = (rect.x, rect.y, rect.width, rect.height)
+    if geom_key != self._geom_key:
+      # alignment
+      bar_w = int(19 * self._scale)
+      right_margin = int(24 * self._scale)
+      bar_x = int(rect.x + rect.width - bar_w - right_margin)
+
+      # vertical span
+      status_dot_radius = int(24 * self._scale)
+      bar_h_max = int(rect.height - 2 * status_dot_radius)
+      bar_h_min = int(160 * self._scale)
+      bar_h = max(bar_h_min, bar_h_max)
+      bar_y = int(rect.y + status_dot_radius)
 
-    aego = clamp(self._aego_f.x, ACCEL_MIN, ACCEL_MAX)
-    ades = clamp(self._ades_f.x, ACCEL_MIN, ACCEL_MAX)
+      radius = max(2.0, 6.0 * self._scale)
+      self._geom = (bar_w, bar_x, bar_y, bar_h, bar_y + bar_h // 2, bar_h / 2.0, radius, 1.0 / rect.width)
+      self._geom_key = geom_key
 
-    naego = clamp(self._norm_acc(aego), -1.0, 1.0)
-    nades = clamp(self._norm_acc(ades), -1.0, 1.0)
+    bar_w, bar_x, bar_y, bar_h, mid_y, half, radius, inv_rect_w = self._geom
 
-    # load scaling (TorqueBar-like growth)
-    self._mag_f.update(clamp(abs(nades), 0.0, 1.0))
-    load = self._mag_f.x
+    dim = 1.0 if colored else 0.55
+    # every alpha byte below scales by the same fade*dim product
+    a_scale = 255 * alpha * dim
+
+    load = round(self._load_x * 128) / 128
 
-    extra_w = int(np.interp(load, [0.5, 1.0], [0, 4]) * self._scale)
+    # scalar equivalent of np.interp(load, [0.5, 1.0], [0, 4]) without the ufunc dispatch
+    extra_w = int(clamp((load - 0.5) * 8.0, 0.0, 4.0) * self._scale)
     bw = bar_w + extra_w
     bx = bar_x - extra_w
 
-    radius = max(2.0, 6.0 * self._scale)
-
     # background
-    bg_alpha = int(255 * (0.18 + 0.10 * load) * alpha * dim)
+    bg_alpha = int((0.18 + 0.10 * load) * a_scale)
     bg_pts = rounded_rect_pts(float(bx), float(bar_y), float(bw), float(bar_h), float(radius), segs=9)
-    draw_polygon(rect, bg_pts, color=rl.Color(255, 255, 255, bg_alpha))
+    draw_polygon(rect, bg_pts, color=_color(255, 255, 255, bg_alpha))
 
     # zero line
-    mid_y = bar_y + bar_h // 2
-    mid_alpha = int(255 * 0.30 * alpha * dim)
-    rl.draw_line(bx, mid_y, bx + bw, mid_y, rl.Color(255, 255, 255, mid_alpha))
+    mid_alpha = int(0.30 * a_scale)
+    rl.draw_line(bx, mid_y, bx + bw, mid_y, _color(255, 255, 255, mid_alpha))
 
-    # desired accel fill
-    half = bar_h / 2.0
+    # desired accel fill; skip the whole color/gradient setup when there is
+    # nothing to fill (nades ~ 0 is the common steady-cruise case)
     fill_h = int(abs(nades) * half)
 
-    if colored:
-      t = clamp((abs(nades) - 0.75) * 4.0, 0.0, 1.0)
-      base = rl.Color(255, 255, 255, int(255 * 0.9 * alpha * dim))
-      hi = rl.Color(255, 200, 0, int(255 * alpha * dim)) if nades >= 0 else \
-           rl.Color(255, 115, 0, int(255 * alpha * dim))
-      fill_start = blend_colors(base, hi, t)
-      fill_end = blend_colors(base, hi, t)
-    else:
-      fill_start = fill_end = rl.Color(255, 255, 255, int(255 * 0.32 * alpha * dim))
-
     if fill_h > 0:
-      if nades >= 0:
-        fy, fh, cap = int(mid_y - fill_h), int(fill_h), "top"
+      if colored:
+        t = clamp((abs(nades) - 0.75) * 4.0, 0.0, 1.0)
+        fill_start = fill_end = (_FILL_POS if nades >= 0 else _FILL_NEG)[int(t * 255)]
       else:
-        fy, fh, cap = int(mid_y), int(fill_h), "bottom"
+        fill_start = fill_end = _color(255, 255, 255, int(0.32 * a_scale))
+
+      top = nades >= 0
+      fy = mid_y - fill_h if top else mid_y
 
-      seg_r = float(min(radius, fh * 0.5))
-      seg_pts = rounded_cap_segment_pts(float(bx), float(fy), float(bw), float(fh), float(seg_r), cap=cap, segs=9)
+      seg_r = min(radius, fill_h * 0.5)
+      seg_pts = fill_cap_pts(self._seg_buf, float(bx), float(fy), float(bw), float(fill_h), seg_r, top)
 
-      cx = ((bx + bw / 2.0) - rect.x) / rect.width
-      ex = (bx - rect.x) / rect.width if (nades < 0) else ((bx + bw) - rect.x) / rect.width
+      cx = ((bx + bw * 0.5) - rect.x) * inv_rect_w
+      ex = (bx - rect.x) * inv_rect_w if (nades < 0) else ((bx + bw) - rect.x) * inv_rect_w
 
       grad = Gradient(start=(cx, 0), end=(ex, 0), colors=[fill_start, fill_end], stops=[0.0, 1.0])
       draw_polygon(rect, seg_pts, gradient=grad)
 
     # actual accel dot
-    dot_alpha = int(255 * (0.75 if colored else 0.50) * alpha * dim)
-    dot_color = rl.Color(255, 255, 255, dot_alpha)
+    dot_alpha = int((0.75 if colored else 0.50) * a_scale)
+    dot_color = _color(255, 255, 255, dot_alpha)
 
     a_off = int((-naego) * half)
     a_y = int(mid_y + a_off)
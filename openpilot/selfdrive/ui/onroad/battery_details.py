@@ -21,6 +21,14 @@ class BatteryPanelConfig:
 
 CONFIG = BatteryPanelConfig()
 
+LABELS = (
+  "Capacity:", "Charge:", "SoC:", "Temperature:",
+  "Heater Active:", "Voltage:", "Current:", "Power:",
+)
+
+# display unit per value column; None marks the boolean heater field
+VALUE_UNITS = ("Wh", "Wh", "%", "°C", None, "V", "A", "kW")
+
 
 class BatteryDetails(Widget):
   def __init__(self) -> None:
@@ -45,6 +53,19 @@ class BatteryDetails(Widget):
     self._data_valid: bool = False
     self._param_update_time: float = 0.0
 
+    # text positions only move when the panel rect does, so build the Vector2
+    # structs once per resize instead of 16 times per frame
+    self._layout_key: tuple[float, float, float, float] | None = None
+    self._label_pos: list[rl.Vector2] = []
+    self._value_pos: list[rl.Vector2] = []
+    self._panel_rect: rl.Rectangle = rl.Rectangle(0, 0, 0, 0)
+    self._text_size: float = 40 * CONFIG.scale_factor
+
+    # formatted value strings, reformatted only when a value moves past the
+    # displayed precision (battery data updates at ~1Hz, the UI at 60Hz)
+    self._values: list[str] = [""] * len(LABELS)
+    self._value_keys: list[float | None] = [None] * len(LABELS)
+
     self._update_params()
 
   def _update_state(self) -> None:
@@ -88,69 +109,57 @@ class BatteryDetails(Widget):
     self._power = 0.0
     self._data_valid = False
 
-  def _render(self, rect: rl.Rectangle) -> None:
-    if not self._display_enabled or not self._data_valid:
-      return
-
+  def _recompute_layout(self, rect: rl.Rectangle) -> None:
     scale = CONFIG.scale_factor
-    base_line_h = CONFIG.line_height
-    line_h = int(base_line_h * scale)
+    line_h = int(CONFIG.line_height * scale)
 
     panel_width = int(rect.width * CONFIG.panel_width_ratio)
     panel_height = line_h * 4
 
-    panel_margin = CONFIG.panel_margin
+    x_start = int(rect.x + rect.width - panel_width - CONFIG.panel_margin)
+    y_start = int(rect.y + rect.height - CONFIG.panel_margin - panel_height)
+
+    column_spacing = panel_width // 2 - 40
+    value_offset = CONFIG.label_width + CONFIG.text_margin
 
-    x_start = int(rect.x + rect.width - panel_width - panel_margin)
-    y_start = int(rect.y + rect.height - panel_margin - panel_height)
+    self._panel_rect = rl.Rectangle(x_start, y_start, panel_width, panel_height)
 
-    panel_rect = rl.Rectangle(x_start, y_start, panel_width, panel_height)
-    rl.draw_rectangle_rounded(panel_rect, 0.1, 8, self._panel_bg)
+    self._label_pos = []
+    self._value_pos = []
+    for i in range(len(LABELS)):
+      base_x = x_start + (i // 4) * column_spacing
+      base_y = y_start + (i % 4) * line_h
+      self._label_pos.append(rl.Vector2(float(base_x), float(base_y)))
+      self._value_pos.append(rl.Vector2(float(base_x + value_offset), float(base_y)))
 
-    label_width = CONFIG.label_width
-    text_margin = CONFIG.text_margin
-    column_spacing = panel_width // 2 - 40
+  def _render(self, rect: rl.Rectangle) -> None:
+    if not self._display_enabled or not self._data_valid:
+      return
 
-    labels = [
-      "Capacity:", "Charge:", "SoC:", "Temperature:",
-      "Heater Active:", "Voltage:", "Current:", "Power:",
-    ]
-
-    values = [
-      f"{self._capacity:.2f} Wh",
-      f"{self._charge:.2f} Wh",
-      f"{self._soc:.2f} %",
-      f"{self._temperature:.2f} °C",
-      "True" if self._heater_active else "False",
-      f"{self._voltage:.2f} V",
-      f"{self._current:.2f} A",
-      f"{self._power:.2f} kW",
-    ]
-
-    for i, (label, value) in enumerate(zip(labels, values, strict=True)):
-      column = i // 4
-      row = i % 4
-
-      base_x = x_start + column * column_spacing
-      base_y = y_start + row * line_h
-
-      label_pos = rl.Vector2(float(base_x), float(base_y))
-      rl.draw_text_ex(
-        self._font,
-        label,
-        label_pos,
-        40 * scale,
-        0,
-        self._label_color,
-      )
-
-      value_x = base_x + label_width + text_margin
-      value_pos = rl.Vector2(float(value_x), float(base_y))
-      rl.draw_text_ex(
-        self._font,
-        value,
-        value_pos,
-        40 * scale,
-        0,
-        self._value_color,
-      )
+    layout_key = (rect.x, rect.y, rect.width, rect.height)
+    if layout_key != self._layout_key:
+      self._recompute_layout(rect)
+      self._layout_key = layout_key
+
+    rl.draw_rectangle_rounded(self._panel_rect, 0.1, 8, self._panel_bg)
+
+    fields = (
+      self._capacity, self._charge, self._soc, self._temperature,
+      self._heater_active, self._voltage, self._current, self._power,
+    )
+    for i, (val, unit) in enumerate(zip(fields, VALUE_UNITS, strict=True)):
+      key = round(val * 100) if unit is not None else val
+      if self._value_keys[i] != key:
+        self._values[i] = f"{val:.2f} {unit}" if unit is not None else ("True" if val else "False")
+        self._value_keys[i] = key
+
+    # bind the hot names once for the 16 draw calls below
+    draw_text_ex = rl.draw_text_ex
+    font = self._font
+    text_size = self._text_size
+    label_color = self._label_color
+    value_color = self._value_color
+
+    for label, value, label_pos, value_pos in zip(LABELS, self._values, self._label_pos, self._value_pos, strict=True):
+      draw_text_ex(font, label, label_pos, text_size, 0, label_color)
+      draw_text_ex(font, value, value_pos, text_size, 0, value_color)